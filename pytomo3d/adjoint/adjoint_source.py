@@ -11,6 +11,7 @@ Methods that handles adjoint sources
 """
 from __future__ import (print_function, division)
 import os
+import numpy as np
 from obspy import Stream, Trace
 import pyadjoint
 from .plot_util import plot_adjoint_source
@@ -29,9 +30,10 @@ def calculate_adjsrc_on_trace(obs, syn, windows, config, adj_src_type,
     :type obs: obspy.Trace
     :param syn: synthetic trace
     :type syn: obspy.Trace
-    :param window_time: window time information, 2-dimension array, like
+    :param windows: list of windows on this channel, or window time
+        information as 2-dimension array, like
         [[win_1_left, win_1_right], [win_2_left, win_2_right], ...]
-    :type windows: 2-d list or numpy.array
+    :type windows: list or numpy.array
     :param config: config of pyadjoint
     :type config: pyadjoint.Config
     :param adj_src_type: adjoint source type, options include:
@@ -54,11 +56,30 @@ def calculate_adjsrc_on_trace(obs, syn, windows, config, adj_src_type,
     # if not isinstance(config, pyadjoint.Config):
     #    raise ValueError("Input config should be pyadjoint.Config")
 
-    window_time = _extract_window_time(windows)
-    if len(window_time.shape) != 2 or window_time.shape[1] != 2:
+    if isinstance(windows, np.ndarray):
+        # no copy if already a float64 array
+        window_time = np.asarray(windows, dtype=np.float64)
+    else:
+        window_time = _extract_window_time(windows)
+    if len(window_time.shape) != 2 or window_time.shape[1] != 2 or \
+            window_time.shape[0] == 0:
         raise ValueError("Input windows dimension incorrect, dimension"
                          "(*, 2) expected")
 
+    return _calculate_adjsrc_on_trace_unchecked(
+        obs, syn, window_time, config, adj_src_type,
+        figure_mode=figure_mode, figure_dir=figure_dir,
+        adjoint_src_flag=adjoint_src_flag)
+
+
+def _calculate_adjsrc_on_trace_unchecked(
+        obs, syn, window_time, config, adj_src_type, figure_mode=False,
+        figure_dir=None, adjoint_src_flag=True):
+    """
+    Calculate adjoint source on a pair of trace, without input checks.
+    The caller is responsible for passing obspy.Trace as obs and syn,
+    and window_time as numpy.array of shape (nwins, 2).
+    """
     adjsrc = pyadjoint.calculate_adjoint_source(
         adj_src_type=adj_src_type, observed=obs, synthetic=syn,
         config=config, window=window_time, adjoint_src=adjoint_src_flag,
@@ -111,6 +132,8 @@ def calculate_adjsrc_on_stream(observed, synthetic, windows, config,
     #    raise ValueError("Input config should be pyadjoint.Config")
 
     adjsrcs_list = []
+    # synthetic traces indexed by component, built on first use
+    syn_by_comp = None
 
     for chan_win in windows.itervalues():
         if len(chan_win) == 0:
@@ -120,17 +143,31 @@ def calculate_adjsrc_on_stream(observed, synthetic, windows, config,
 
         try:
             obs = observed.select(id=obsd_id)[0]
-        except:
+        except IndexError:
             raise ValueError("Missing observed trace for window: %s" % obsd_id)
 
         if synt_id == "UNKNOWN":
-            syn = synthetic.select(channel="*%s" % obs.stats.channel[-1])[0]
+            if syn_by_comp is None:
+                # keep the first trace of each component and ignore
+                # case, as Stream.select would
+                syn_by_comp = {}
+                for tr in synthetic:
+                    if tr.stats.channel:
+                        syn_by_comp.setdefault(
+                            tr.stats.channel[-1].upper(), tr)
+            try:
+                syn = syn_by_comp[obs.stats.channel[-1].upper()]
+            except KeyError:
+                raise ValueError("Missing synthetic trace for window: %s"
+                                 % obsd_id)
         else:
             syn = synthetic.select(id=synt_id)[0]
 
-        adjsrc = calculate_adjsrc_on_trace(
-            obs, syn, windows[obsd_id], config, adj_src_type,
-            adjoint_src_flag=adjoint_src_flag,
+        # traces come from the checked streams and chan_win is not
+        # empty, so the trace level checks are skipped
+        adjsrc = _calculate_adjsrc_on_trace_unchecked(
+            obs, syn, _extract_window_time(chan_win), config,
+            adj_src_type, adjoint_src_flag=adjoint_src_flag,
             figure_mode=figure_mode, figure_dir=figure_dir)
 
         if adjsrc is None:
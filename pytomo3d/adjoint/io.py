@@ -13,6 +13,10 @@ from __future__ import (print_function, division)
 import yaml
 import numpy as np
 import pyadjoint
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:
+    from yaml import SafeLoader as Loader
 
 
 def load_adjoint_config_yaml(filename):
@@ -20,7 +24,7 @@ def load_adjoint_config_yaml(filename):
     load yaml and setup pyadjoint.Config object
     """
     with open(filename) as fh:
-        data = yaml.load(fh)
+        data = yaml.load(fh, Loader=Loader)
 
     adjsrc_type = data["adj_src_type"]
     data.pop("adj_src_type")
@@ -55,13 +59,13 @@ def _extract_window_id(windows):
             obs_id = _win["channel_id"]
             try:
                 syn_id = _win["channel_id_2"]
-            except:
+            except KeyError:
                 syn_id = "UNKNOWN"
         else:
             obs_id = _win.channel_id
             try:
                 syn_id = _win.channel_id_2
-            except:
+            except AttributeError:
                 syn_id = "UNKNOWN"
         obs_ids.append(obs_id)
         syn_ids.append(syn_id)
@@ -84,12 +88,12 @@ def _extract_window_time(windows):
     """
     Extract window time information from a list of windows.
     """
-    win_time = []
-    for _win in windows:
+    win_time = np.empty((len(windows), 2), dtype=np.float64)
+    for idx, _win in enumerate(windows):
         if isinstance(_win, dict):
-            win_time.append([_win["relative_starttime"],
-                             _win["relative_endtime"]])
+            win_time[idx, 0] = _win["relative_starttime"]
+            win_time[idx, 1] = _win["relative_endtime"]
         else:
-            win_time.append([_win.relative_starttime,
-                             _win.relative_endtime])
-    return np.array(win_time)
+            win_time[idx, 0] = _win.relative_starttime
+            win_time[idx, 1] = _win.relative_endtime
+    return win_time
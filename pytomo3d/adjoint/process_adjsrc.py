@@ -87,12 +87,9 @@ def convert_adjs_to_stream(adjsrcs):
     tools will be available for processing. Return values
     for adjoint stream and other information
     """
-    meta_info = {}
-    adj_stream = Stream()
-    for adj in adjsrcs:
-        _tr, _meta = convert_adj_to_trace(adj)
-        adj_stream.append(_tr)
-        meta_info[_tr.id] = _meta
+    converted = [convert_adj_to_trace(adj) for adj in adjsrcs]
+    adj_stream = Stream(traces=[_tr for _tr, _ in converted])
+    meta_info = {_tr.id: _meta for _tr, _meta in converted}
     return adj_stream, meta_info
 
 
@@ -167,9 +164,11 @@ def zero_padding_stream(stream, starttime, endtime):
 
         # recalculate the time for padding trace
         padding_starttime = tr_starttime - npts_before * dt
-        padding_array = np.zeros(npts_before + npts + npts_after)
-        padding_array[npts_before:(npts_before + npts)] = \
-            tr.data[:]
+        # only zero the padding regions, the middle is overwritten
+        padding_array = np.empty(npts_before + npts + npts_after)
+        padding_array[:npts_before] = 0.0
+        padding_array[npts_before:(npts_before + npts)] = tr.data[:]
+        padding_array[(npts_before + npts):] = 0.0
 
         tr.data = padding_array
         tr.stats.starttime = padding_starttime
@@ -186,12 +185,12 @@ def sum_adjoint_no_weighting(adj_stream, meta_info):
     """
     new_stream = Stream()
     new_meta = {}
-    done_comps = []
+    done_comps = set()
     for tr in adj_stream:
         comp = tr.stats.channel[-1]
         # print(comp, done_comps)
         if comp not in done_comps:
-            done_comps.append(comp)
+            done_comps.add(comp)
             comp_tr = tr.copy()
             comp_tr.stats.location = ""
             comp_tr.stats.channel = "MX" + comp
@@ -208,13 +207,17 @@ def sum_adjoint_no_weighting(adj_stream, meta_info):
 def sum_adjoint_with_weighting(adj_stream, meta_info, weight_dict):
     new_stream = Stream()
     new_meta = {}
-    done_comps = []
+    done_comps = set()
+    # index the adjoint traces once instead of scanning per channel
+    adj_map = {tr.id: tr for tr in adj_stream}
+    # scratch buffer for weighted data, reused across channels
+    weighted = None
     # sum using components weight
     for comp, comp_weights in weight_dict.iteritems():
         for chan_id, chan_weight in comp_weights.iteritems():
             if comp not in done_comps:
-                done_comps.append(comp)
-                adj_tr = adj_stream.select(id=chan_id)[0]
+                done_comps.add(comp)
+                adj_tr = adj_map[chan_id]
                 comp_tr = adj_tr.copy()
                 comp_tr.data *= chan_weight
                 comp_tr.stats.location = ""
@@ -224,9 +227,14 @@ def sum_adjoint_with_weighting(adj_stream, meta_info, weight_dict):
                 new_meta[comp_tr.id]["misfit"] = \
                     chan_weight * meta_info[adj_tr.id]["misfit"]
             else:
-                adj_tr = adj_stream.select(id=chan_id)[0]
+                adj_tr = adj_map[chan_id]
                 comp_tr = new_stream.select(channel="*%s" % comp)[0]
-                comp_tr.data += chan_weight * adj_tr.data
+                if weighted is None or \
+                        weighted.shape != comp_tr.data.shape or \
+                        weighted.dtype != comp_tr.data.dtype:
+                    weighted = np.empty_like(comp_tr.data)
+                np.multiply(adj_tr.data, chan_weight, out=weighted)
+                np.add(comp_tr.data, weighted, out=comp_tr.data)
                 new_meta[comp_tr.id]["misfit"] += \
                     chan_weight * meta_info[adj_tr.id]["misfit"]
     return new_stream, new_meta
@@ -266,7 +274,7 @@ def add_missing_components(stream, component_list=["Z", "R", "T"]):
     measurements, so we just set the missing components to
     zero trace
     """
-    done_list = []
+    done_list = set()
 
     nadds = 0
     for tr in stream:
@@ -275,20 +283,33 @@ def add_missing_components(stream, component_list=["Z", "R", "T"]):
         loc = tr.stats.location
         station_id = "%s.%s.%s" % (nw, sta, loc)
         if station_id not in done_list:
+            done_list.add(station_id)
             stream_sta = stream.select(network=nw, station=sta, location=loc)
         else:
             continue
 
-        missinglist = component_list[:]
         # search for missing location id list
-        for tr in stream_sta:
-            missinglist.remove(tr.stats.channel[-1])
+        components = {_tr.stats.channel[-1] for _tr in stream_sta}
+        if len(components) != len(stream_sta):
+            raise ValueError("Duplicate components in %s: %s"
+                             % (station_id,
+                                [_tr.id for _tr in stream_sta]))
+        if not components.issubset(component_list):
+            raise ValueError("Components(%s) of %s not in component_list: %s"
+                             % (sorted(components), station_id,
+                                component_list))
+        missinglist = [comp for comp in component_list
+                       if comp not in components]
 
         tr_template = stream_sta[0]
         for component in missinglist:
             nadds += 1
-            zero_trace = tr_template.copy()
-            zero_trace.data.fill(0.0)
+            # build the zero trace directly instead of copying the
+            # template data and then overwriting it
+            zero_trace = Trace(
+                data=np.zeros(tr_template.stats.npts,
+                              dtype=tr_template.data.dtype),
+                header=deepcopy(tr_template.stats))
             zero_trace.stats.channel = \
                 "%s%s" % (tr_template.stats.channel[0:2], component)
             stream.append(zero_trace)
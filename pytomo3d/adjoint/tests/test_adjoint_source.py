@@ -1,7 +1,8 @@
 import os
 import inspect
 import json
-from obspy import read, Stream
+import numpy as np
+from obspy import read, Stream, Trace
 from pyflex.window import Window
 import pytomo3d.adjoint.adjoint_source as adj
 import pytomo3d.adjoint.io as adj_io
@@ -85,6 +86,15 @@ def test_calculate_adjsrc_on_trace_raises_bad_windows_shape():
                                       adj_src_type="multitaper_misfit")
 
 
+def test_calculate_adjsrc_on_trace_raises_bad_windows_array_shape():
+    obs, syn, win_time = setup_calculate_adjsrc_on_trace_args()
+    config = load_config_multitaper()
+    win_time = np.zeros((2, 3))
+    with pytest.raises(ValueError):
+        adj.calculate_adjsrc_on_trace(obs, syn, win_time, config,
+                                      adj_src_type="multitaper_misfit")
+
+
 def test_calculate_adjsrc_on_trace_figure_mode_none_figure_dir():
     obs, syn, win_time = setup_calculate_adjsrc_on_trace_args()
     config = load_config_multitaper()
@@ -175,6 +185,43 @@ def test_calculate_adjsrc_on_stream_raises_if_windows_is_empty():
     assert ret is None
 
 
+def test_calculate_adjsrc_on_stream_raises_if_obs_trace_missing():
+    obs, syn, windows = setup_calculate_adjsrc_on_stream_args()
+    config = load_config_multitaper()
+    obs = Stream()
+    with pytest.raises(ValueError):
+        adj.calculate_adjsrc_on_stream(obs, syn, windows, config,
+                                       adj_src_type="multitaper_misfit")
+
+
+def test_calculate_adjsrc_on_stream_raises_if_syn_trace_missing():
+    obs, _, windows = setup_calculate_adjsrc_on_stream_args()
+    config = load_config_multitaper()
+    # without channel_id_2 the synthetic is looked up by component
+    for chan_win in windows.itervalues():
+        for _win in chan_win:
+            _win.pop("channel_id_2")
+    syn = read(synfile)
+    syn.remove(syn.select(channel="*R")[0])
+    with pytest.raises(ValueError):
+        adj.calculate_adjsrc_on_stream(obs, syn, windows, config,
+                                       adj_src_type="multitaper_misfit")
+
+
+def test_calculate_adjsrc_on_stream_skips_syn_trace_without_channel():
+    obs, _, windows = setup_calculate_adjsrc_on_stream_args()
+    config = load_config_multitaper()
+    # without channel_id_2 the synthetic is looked up by component
+    for chan_win in windows.itervalues():
+        for _win in chan_win:
+            _win.pop("channel_id_2")
+    syn = read(synfile)
+    syn.insert(0, Trace(data=np.zeros(10)))
+    adjsrcs = adj.calculate_adjsrc_on_stream(
+        obs, syn, windows, config, adj_src_type="multitaper_misfit")
+    assert len(adjsrcs) == 1
+
+
 # def test_calculate_adjsrc_on_stream_multitaper_misfit_produces_adjsrc():
 #    obs, syn, windows = setup_calculate_adjsrc_on_stream_args()
 #    config = load_config_traveltime()
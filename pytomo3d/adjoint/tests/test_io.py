@@ -1,5 +1,7 @@
 import os
 import inspect
+import numpy as np
+import numpy.testing as npt
 import pytomo3d.adjoint.io as adj_io
 import pytest
 import pyadjoint
@@ -105,3 +107,45 @@ def test_load_adjoint_config_yaml_for_multitaper_misfit():
     assert config.dlna_sigma_min == 0.5
     assert config.use_cc_error
     assert not config.use_mt_error
+
+
+def test_extract_window_time():
+    windows = [{"relative_starttime": 10.0, "relative_endtime": 20.0},
+               {"relative_starttime": 30.0, "relative_endtime": 45.5}]
+    win_time = adj_io._extract_window_time(windows)
+    assert win_time.shape == (2, 2)
+    assert win_time.dtype == np.float64
+    npt.assert_allclose(win_time, [[10.0, 20.0], [30.0, 45.5]])
+
+
+class _FakeWindow(object):
+    def __init__(self, channel_id):
+        self.channel_id = channel_id
+
+
+class _BrokenWindow(_FakeWindow):
+    @property
+    def channel_id_2(self):
+        raise RuntimeError("broken window")
+
+
+def test_extract_window_id():
+    windows = [{"channel_id": "II.AAK.00.BHZ",
+                "channel_id_2": "II.AAK.S3.MXZ"}] * 2
+    assert adj_io._extract_window_id(windows) == \
+        ("II.AAK.00.BHZ", "II.AAK.S3.MXZ")
+
+    # missing channel_id_2 falls back to "UNKNOWN"
+    windows = [{"channel_id": "II.AAK.00.BHZ"}] * 2
+    assert adj_io._extract_window_id(windows) == \
+        ("II.AAK.00.BHZ", "UNKNOWN")
+
+    windows = [_FakeWindow("II.AAK.00.BHZ")] * 2
+    assert adj_io._extract_window_id(windows) == \
+        ("II.AAK.00.BHZ", "UNKNOWN")
+
+
+def test_extract_window_id_does_not_swallow_other_errors():
+    windows = [_BrokenWindow("II.AAK.00.BHZ")]
+    with pytest.raises(RuntimeError):
+        adj_io._extract_window_id(windows)
@@ -3,6 +3,7 @@ import inspect
 from copy import deepcopy
 import numpy as np
 import numpy.testing as npt
+import pytest
 import obspy
 from obspy import UTCDateTime, read
 from pyadjoint import AdjointSource
@@ -292,6 +293,46 @@ def test_add_missing_components():
     assert trr.stats.starttime == starttime
 
 
+def test_add_missing_components_multiple_stations():
+    array = np.array([1., 2., 3., 4., 5.])
+    starttime = UTCDateTime(1990, 1, 1)
+    adjsrcs = get_sample_adjsrcs(array, starttime)
+    st, _ = pa.convert_adjs_to_stream(adjsrcs)
+    st.remove(st.select(component="Z")[0])
+
+    tr = st[0].copy()
+    tr.stats.station = "ABC"
+    tr.stats.channel = "BHZ"
+    st.append(tr)
+
+    nadds = pa.add_missing_components(st)
+    assert nadds == 3
+    assert len(st) == 6
+    assert [_tr.id for _tr in st[3:]] == \
+        ["II.AAK..BHZ", "II.ABC..BHR", "II.ABC..BHT"]
+    for _tr in st[3:]:
+        npt.assert_allclose(_tr.data, np.zeros(5))
+        assert _tr.stats.starttime == starttime
+
+
+def test_add_missing_components_raises_on_duplicate_component():
+    array = np.array([1., 2., 3., 4., 5.])
+    starttime = UTCDateTime(1990, 1, 1)
+    adjsrcs = get_sample_adjsrcs(array, starttime)
+    st, _ = pa.convert_adjs_to_stream(adjsrcs)
+    tr = st.select(component="Z")[0].copy()
+    tr.stats.channel = "HHZ"
+    st.append(tr)
+    with pytest.raises(ValueError):
+        pa.add_missing_components(st)
+
+
+def test_add_missing_components_raises_on_unknown_component():
+    st = SAMPLE_STREAM.copy()
+    with pytest.raises(ValueError):
+        pa.add_missing_components(st, component_list=["Z", "R", "T"])
+
+
 def test_rotate_adj_stream():
     # rotate from NEZ to RTZ and rotate back
     st = SAMPLE_STREAM.copy()
@@ -1,5 +1,7 @@
 import os
 import inspect
+from copy import deepcopy
+import numpy.testing as npt
 from obspy import read
 import pytomo3d.adjoint.utils as adj_utils
 # import pyadjoint.adjoint_source
@@ -53,3 +55,23 @@ class TestUtilOne:
         adj_utils.change_adjsrc_channel_name(adjsrcs, "MX")
         for adj in adjsrcs:
             assert adj.component[:2] == "MX"
+
+    def test_calculate_chan_weight(self):
+        adjsrcs = self.get_fake_adjsrcs()
+        adj_z = deepcopy([adj for adj in adjsrcs
+                          if adj.component == "BHZ"][0])
+        adj_z.location = "00"
+        adjsrcs.append(adj_z)
+
+        windows = {
+            "IU.KBL..BHZ": [{"channel_id": "IU.KBL..BHZ"}] * 3,
+            "IU.KBL.00.BHZ": [{"channel_id": "IU.KBL.00.BHZ"}],
+            "IU.KBL..BHR": [{"channel_id": "IU.KBL..BHR"}] * 2,
+            "IU.KBL..BHT": [],
+            "IU.KBL.10.BHT": [{"channel_id": "IU.KBL.10.BHT"}]}
+        weights = adj_utils.calculate_chan_weight(adjsrcs, windows)
+
+        assert set(weights.keys()) == set(["MXZ", "MXR"])
+        npt.assert_almost_equal(weights["MXZ"]["IU.KBL..BHZ"], 0.75)
+        npt.assert_almost_equal(weights["MXZ"]["IU.KBL.00.BHZ"], 0.25)
+        assert weights["MXR"] == {"IU.KBL..BHR": 1.0}
@@ -56,19 +56,13 @@ def _stats_channel_window(adjsrcs, windows):
                                   adj.component)
         adj_dict[adj_id] = idx
 
-    adj_win_dict = {}
-    for chan_win in windows.itervalues():
-        if len(chan_win) == 0:
-            continue
-        chan_id = chan_win[0]["channel_id"]
-        adj_win_dict[chan_id] = len(chan_win)
+    # count windows and drop channels without adjoint source in one pass
+    adj_win_dict = {chan_win[0]["channel_id"]: len(chan_win)
+                    for chan_win in windows.itervalues()
+                    if len(chan_win) > 0
+                    and chan_win[0]["channel_id"] in adj_dict}
 
-    new_win_dict = {}
-    for key in adj_win_dict:
-        if key in adj_dict:
-            new_win_dict[key] = adj_win_dict[key]
-
-    return adj_dict, new_win_dict
+    return adj_dict, adj_win_dict
 
 
 def calculate_chan_weight(adjsrcs, windows_sta):
@@ -90,11 +84,9 @@ def calculate_chan_weight(adjsrcs, windows_sta):
         comp_dict[comp][tr_id] = nwins
 
     for comp, comp_wins in comp_dict.iteritems():
-        ntotal = 0
-        for chan_id, chan_win in comp_wins.iteritems():
-            ntotal += chan_win
-        for chan_id, chan_win in comp_wins.iteritems():
-            comp_dict[comp][chan_id] = chan_win / ntotal
+        ntotal = sum(comp_wins.itervalues())
+        comp_dict[comp] = {chan_id: chan_win / ntotal
+                           for chan_id, chan_win in comp_wins.iteritems()}
 
     return comp_dict
 
@@ -15,8 +15,9 @@ def sort_windows_on_channel_and_location(sta_win):
     """
     sort_dict = {}
     for trace_id, trace_win in sta_win.iteritems():
-        chan = trace_id.split('.')[-1][0:2]
-        loc = trace_id.split('.')[-2]
+        id_parts = trace_id.split('.')
+        chan = id_parts[-1][0:2]
+        loc = id_parts[-2]
         if chan not in sort_dict:
             sort_dict[chan] = {}
         if loc not in sort_dict[chan]: